@@ -541,22 +541,21 @@ async def benchmark_multiple_formulas(n_formula: int = 100, n_msg: int = 100) ->
         "batteries_active_power": batteries_active_power_chan.get_sender(),
         "batteries_active_power_bounds": batteries_active_power_bounds_chan.get_sender(),
     }
-    for index in range(n_formula):
-        locals()["f" + str(index) + "_chan"] = Broadcast[TimeSeriesEntry[Any]](
-            "f" + str(index)
-        )
-        senders["f" + str(index)] = locals()["f" + str(index) + "_chan"].get_sender()
+    formula_chans: Dict[str, Broadcast[TimeSeriesEntry[Any]]] = {
+        "f" + str(index): Broadcast[TimeSeriesEntry[Any]]("f" + str(index))
+        for index in range(n_formula)
+    }
+    for name, chan in formula_chans.items():
+        senders[name] = chan.get_sender()
     formula_calculator = FormulaCalculator(
         component_graph, additional_formulas=microgrid_formulas
     )
     _microgrid_actor = MicrogridData(
         microgrid_client, component_graph, senders, formula_calculator
     )
-    recv = {}
-    for index in range(n_formula):
-        recv["f" + str(index)] = locals()["f" + str(index) + "_chan"].get_receiver()
-
-    recv_merged = MergeNamed(**recv)
+    recv_merged = MergeNamed(
+        **{name: chan.get_receiver() for name, chan in formula_chans.items()}
+    )
     n_formula_msg = {"f" + str(fi): 0 for fi in range(n_formula)}
     start = time.time()
     async for msg in recv_merged:
@@ -7,7 +7,9 @@ License
 MIT
 """
 
-from typing import Any, Dict
+from __future__ import annotations
+
+from typing import Any
 
 from frequenz.channels import Broadcast, Receiver, Sender
 
@@ -19,6 +21,8 @@ class ChannelRegistry:
     between each other.  Channels are identified by string names.
     """
 
+    __slots__ = ("_name", "_channels")
+
     def __init__(self, *, name: str) -> None:
         """Create a `ChannelRegistry` instance.
 
@@ -26,7 +30,21 @@ class ChannelRegistry:
             name: A unique name for the registry.
         """
         self._name = name
-        self._channels: Dict[str, Broadcast[Any]] = {}
+        self._channels: dict[str, Broadcast[Any]] = {}
+
+    def _get_or_create(self, key: str) -> Broadcast[Any]:
+        """Get the channel with the given key, creating it if necessary.
+
+        Args:
+            key: A key to identify the channel.
+
+        Returns:
+            The channel with the given key.
+        """
+        chan = self._channels.get(key)
+        if chan is None:
+            chan = self._channels[key] = Broadcast(f"{self._name}-{key}")
+        return chan
 
     def get_sender(self, key: str) -> Sender[Any]:
         """Get a sender to a dynamically created channel with the given key.
@@ -37,9 +55,7 @@ class ChannelRegistry:
         Returns:
             A sender to a dynamically created channel with the given key.
         """
-        if key not in self._channels:
-            self._channels[key] = Broadcast(f"{self._name}-{key}")
-        return self._channels[key].get_sender()
+        return self._get_or_create(key).get_sender()
 
     def get_receiver(self, key: str) -> Receiver[Any]:
         """Get a receiver to a dynamically created channel with the given key.
@@ -50,6 +66,4 @@ class ChannelRegistry:
         Returns:
             A receiver for a dynamically created channel with the given key.
         """
-        if key not in self._channels:
-            self._channels[key] = Broadcast(f"{self._name}-{key}")
-        return self._channels[key].get_receiver()
+        return self._get_or_create(key).get_receiver()
@@ -44,19 +44,21 @@ def infer_microgrid_config(
     """
     component_infos = []
     bat_inv_mappings = {}
+    components = graph.components()
     component_category_mappings = {
-        component.component_id: component.category for component in graph.components()
+        component.component_id: component.category for component in components
     }
-    for component in graph.components():
+    for component in components:
+        component_id = component.component_id
         meter_connection = None
-        predecessors = graph.predecessors(component.component_id)
-        successors = graph.successors(component.component_id)
-        if component.category == ComponentCategory.METER:
+        predecessors = graph.predecessors(component_id)
+        successors = graph.successors(component_id)
+        if component.category is ComponentCategory.METER:
             connections = [
                 comp
                 for comp in predecessors | successors
                 if component_category_mappings[comp.component_id]
-                != ComponentCategory.JUNCTION
+                is not ComponentCategory.JUNCTION
             ]
             if len(connections) == 1:
                 meter_connection = component_category_mappings[
@@ -68,17 +70,17 @@ def infer_microgrid_config(
             }:
                 component_infos.append(
                     ComponentInfo(
-                        component.component_id,
+                        component_id,
                         component.category,
                         meter_connection=meter_connection,
                     )
                 )
 
-        elif component.category == ComponentCategory.BATTERY:
+        elif component.category is ComponentCategory.BATTERY:
             if len(predecessors) == 0:
                 logger.warning(
                     "Battery %d doesn't have any predecessors!",
-                    component.component_id,
+                    component_id,
                 )
                 continue
 
@@ -86,36 +88,36 @@ def infer_microgrid_config(
                 inverter_ids = [
                     comp.component_id
                     for comp in predecessors
-                    if comp.category == ComponentCategory.INVERTER
+                    if comp.category is ComponentCategory.INVERTER
                 ]
                 logger.warning(
                     "Configurations with a single battery %d "
                     "and multiple inverters %s are not supported!",
-                    component.component_id,
+                    component_id,
                     inverter_ids,
                 )
 
             if len(predecessors) >= 1:
                 predecessor = predecessors.pop()
-                bat_inv_mappings[component.component_id] = predecessor.component_id
+                bat_inv_mappings[component_id] = predecessor.component_id
                 component_infos.append(
                     ComponentInfo(
-                        component.component_id,
+                        component_id,
                         component.category,
                         meter_connection=meter_connection,
                     )
                 )
-        elif component.category == ComponentCategory.INVERTER:
+        elif component.category is ComponentCategory.INVERTER:
             if len(successors) > 1:
                 battery_ids = [
                     comp.component_id
                     for comp in successors
-                    if comp.category == ComponentCategory.BATTERY
+                    if comp.category is ComponentCategory.BATTERY
                 ]
                 logger.warning(
                     "Configurations with a single inverter %d "
                     "and multiple batteries %s are not supported!",
-                    component.component_id,
+                    component_id,
                     battery_ids,
                 )
 
@@ -123,19 +125,19 @@ def infer_microgrid_config(
                 successor = successors.pop()
                 if (
                     component_category_mappings[successor.component_id]
-                    == ComponentCategory.BATTERY
+                    is ComponentCategory.BATTERY
                 ):
                     component_infos.append(
                         ComponentInfo(
-                            component.component_id,
+                            component_id,
                             component.category,
                             meter_connection=meter_connection,
                         )
                     )
-        elif component.category == ComponentCategory.EV_CHARGER:
+        elif component.category is ComponentCategory.EV_CHARGER:
             component_infos.append(
                 ComponentInfo(
-                    component.component_id,
+                    component_id,
                     component.category,
                     meter_connection=meter_connection,
                 )
@@ -102,6 +102,9 @@ class FormulaCalculator:  # pylint: disable=too-many-instance-attributes
         )
         self.component_infos = component_infos
         self.battery_inverter_mappings = battery_inverter_mappings
+        self._components_by_category: Optional[
+            Dict[ComponentCategory, ComponentGroupInfo]
+        ] = None
         self.battery_ids_overrides = battery_ids_overrides
         self.microgrid_formulas: Dict[str, TimeSeriesFormula[Any]] = (
             {} if additional_formulas is None else additional_formulas
@@ -497,41 +500,35 @@ class FormulaCalculator:  # pylint: disable=too-many-instance-attributes
         )
         self._add_formula(METRIC_BATTERIES_CAPACITY, batteries_capacity_formula)
 
-    def _make_group(
-        self, component_category: ComponentCategory, attr: str
-    ) -> List[Any]:
-        """Filter components by type and return a single attribute for all of them.
-
-        Args:
-            component_category: components of which type to include in the
-                result.
-            attr: attribute to return for all components of type
-                `component_category`.
-
-        Returns:
-            Single attribute of all components of type `component_category`.
-        """
-        return [
-            getattr(info, attr)
-            for info in self.component_infos
-            if info.category == component_category
-        ]
-
     def _group_components(self) -> Dict[ComponentCategory, ComponentGroupInfo]:
         """Group components by component category.
 
+        The grouping depends only on `component_infos`, which is fixed at
+        construction time, so it is computed once in a single pass and cached
+        for subsequent calls.
+
         Returns:
             Components grouped by type, where groups hold information about
             component IDs and meter connections.
         """
-        meter_connections = self._make_group(
-            ComponentCategory.METER, "meter_connection"
-        )
-
-        meter_ids = self._make_group(ComponentCategory.METER, "component_id")
-        battery_ids = self._make_group(ComponentCategory.BATTERY, "component_id")
-        inverter_ids = self._make_group(ComponentCategory.INVERTER, "component_id")
-        ev_charger_ids = self._make_group(ComponentCategory.EV_CHARGER, "component_id")
+        if self._components_by_category is not None:
+            return self._components_by_category
+
+        meter_ids: List[int] = []
+        meter_connections: List[Optional[ComponentCategory]] = []
+        battery_ids: List[int] = []
+        inverter_ids: List[int] = []
+        ev_charger_ids: List[int] = []
+        for info in self.component_infos:
+            if info.category is ComponentCategory.METER:
+                meter_ids.append(info.component_id)
+                meter_connections.append(info.meter_connection)
+            elif info.category is ComponentCategory.BATTERY:
+                battery_ids.append(info.component_id)
+            elif info.category is ComponentCategory.INVERTER:
+                inverter_ids.append(info.component_id)
+            elif info.category is ComponentCategory.EV_CHARGER:
+                ev_charger_ids.append(info.component_id)
 
         components_by_type = {
             ComponentCategory.METER: ComponentGroupInfo(
@@ -547,6 +544,7 @@ class FormulaCalculator:  # pylint: disable=too-many-instance-attributes
                 ids=ev_charger_ids, connections=[]
             ),
         }
+        self._components_by_category = components_by_type
         return components_by_type
 
     def _create_default_inverter_symbol_mappings(
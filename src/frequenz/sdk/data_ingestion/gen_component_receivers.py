@@ -45,11 +45,11 @@ def transform_ev_charger_data(
     Returns:
         Metrics collected from an EV Charger.
     """
-    result: Dict[str, Any] = {}
-    result[METRIC_COMPONENT_ID] = data.component_id
-    result[METRIC_TIMESTAMP] = data.timestamp
-    result[METRIC_EV_ACTIVE_POWER] = data.active_power
-    return result
+    return {
+        METRIC_COMPONENT_ID: data.component_id,
+        METRIC_TIMESTAMP: data.timestamp,
+        METRIC_EV_ACTIVE_POWER: data.active_power,
+    }
 
 
 def transform_inverter_data(
@@ -63,15 +63,15 @@ def transform_inverter_data(
     Returns:
         Metrics collected from an Inverter.
     """
-    result: Dict[str, Any] = {}
-    result[METRIC_COMPONENT_ID] = data.component_id
-    result[METRIC_TIMESTAMP] = data.timestamp
-    result[METRIC_ACTIVE_POWER_UPPER_BOUND] = data.active_power_upper_bound
-    result[METRIC_ACTIVE_POWER_LOWER_BOUND] = data.active_power_lower_bound
-    # Active Power shouldn't be a single value, but bounds instead
-    # Bounds(data.active_power_lower_bound, data.active_power_upper_bound)
-    result[METRIC_ACTIVE_POWER] = data.active_power
-    return result
+    return {
+        METRIC_COMPONENT_ID: data.component_id,
+        METRIC_TIMESTAMP: data.timestamp,
+        METRIC_ACTIVE_POWER_UPPER_BOUND: data.active_power_upper_bound,
+        METRIC_ACTIVE_POWER_LOWER_BOUND: data.active_power_lower_bound,
+        # Active Power shouldn't be a single value, but bounds instead
+        # Bounds(data.active_power_lower_bound, data.active_power_upper_bound)
+        METRIC_ACTIVE_POWER: data.active_power,
+    }
 
 
 def transform_meter_data(
@@ -85,11 +85,11 @@ def transform_meter_data(
     Returns:
         Metrics collected from a Meter.
     """
-    result: Dict[str, Any] = {}
-    result[METRIC_COMPONENT_ID] = data.component_id
-    result[METRIC_TIMESTAMP] = data.timestamp
-    result[METRIC_ACTIVE_POWER] = data.active_power
-    return result
+    return {
+        METRIC_COMPONENT_ID: data.component_id,
+        METRIC_TIMESTAMP: data.timestamp,
+        METRIC_ACTIVE_POWER: data.active_power,
+    }
 
 
 def transform_battery_data(
@@ -103,14 +103,14 @@ def transform_battery_data(
     Returns:
         Metrics collected from a Battery.
     """
-    result: Dict[str, Any] = {}
-    result[METRIC_COMPONENT_ID] = data.component_id
-    result[METRIC_TIMESTAMP] = data.timestamp
-    result[METRIC_SOC] = data.soc
-    result[METRIC_CAPACITY] = data.capacity
-    result[METRIC_POWER_UPPER_BOUND] = data.power_upper_bound
-    result[METRIC_POWER_LOWER_BOUND] = data.power_lower_bound
-    return result
+    return {
+        METRIC_COMPONENT_ID: data.component_id,
+        METRIC_TIMESTAMP: data.timestamp,
+        METRIC_SOC: data.soc,
+        METRIC_CAPACITY: data.capacity,
+        METRIC_POWER_UPPER_BOUND: data.power_upper_bound,
+        METRIC_POWER_LOWER_BOUND: data.power_lower_bound,
+    }
 
 
 async def _create_meter_receiver(
@@ -13,7 +13,7 @@ MIT
 import asyncio
 import datetime as dt
 import logging
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Coroutine, Dict, List, Optional, Set
 
 import pytz
 from frequenz.channels import Broadcast, Merge, Receiver, Select, Sender
@@ -97,12 +97,13 @@ class MicrogridData:  # pylint: disable=too-many-instance-attributes
         """Send formulas results with some period."""
         # Sleep first to collect initial data from all component
         await asyncio.sleep(self._wait_for_data_sec)
-        tasks: List["asyncio.Task[bool]"] = []
         while True:
             start_time = dt.datetime.now(tz=pytz.UTC)
             # For every formula that was updated at least once, send that formula.
+            sends: List[Coroutine[Any, Any, bool]] = []
             for name, formula_result in self.formula_calculator.results.items():
-                if name not in self._outputs:
+                sender = self._outputs.get(name)
+                if sender is None:
                     # If formula was computed but there is not output channel in
                     # MicrogridData then it is bug in MicrogridData.
                     logger.error(
@@ -110,10 +111,9 @@ class MicrogridData:  # pylint: disable=too-many-instance-attributes
                         name,
                     )
                 else:
-                    task = asyncio.create_task(self._outputs[name].send(formula_result))
-                    tasks.append(task)
+                    sends.append(sender.send(formula_result))
 
-            await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.gather(*sends, return_exceptions=True)
             diff: float = (dt.datetime.now(pytz.UTC) - start_time).total_seconds()
             if diff >= self._formula_update_interval_sec:
                 logger.error(
@@ -226,6 +226,9 @@ class MicrogridData:  # pylint: disable=too-many-instance-attributes
 
     async def run(self) -> None:
         """Run the actor."""
+        # the output channels never change, so build the formula-name set once
+        # instead of once per received message
+        output_names = set(self._outputs.keys())
         while True:
             receivers = await gen_component_receivers(
                 self.component_infos, self.microgrid_client
@@ -244,7 +247,7 @@ class MicrogridData:  # pylint: disable=too-many-instance-attributes
                         msg.inner
                     )
                     self.formula_calculator.compute(
-                        updated_symbols, only_formula_names=set(self._outputs.keys())
+                        updated_symbols, only_formula_names=output_names
                     )
                 elif msg := select.config_update_receiver:
                     try:
@@ -291,6 +291,8 @@ class MicrogridGrpcClient(MicrogridApiClient):
             sender: A channel sender, to send the component data to.
         """
         retry_spec: RetryStrategy = self._retry_spec.copy()
+        # resolve the bound method once instead of once per streamed message
+        send = sender.send
         while True:
             logger.debug(
                 "Making call to `GetComponentData`, for component_id=%d", component_id
@@ -300,7 +302,7 @@ class MicrogridGrpcClient(MicrogridApiClient):
                     microgrid_pb.ComponentIdParam(id=component_id)
                 )
                 async for msg in call:
-                    await sender.send(transform(msg))
+                    await send(transform(msg))
             except grpc.aio.AioRpcError as err:
                 api_details = f"Microgrid API: {self.target}."
                 logger.exception(
@@ -27,8 +27,7 @@ MIT
 import asyncio
 import logging
 from abc import ABC, abstractmethod
-from dataclasses import asdict
-from typing import Callable, Iterable, List, Optional, Set
+from typing import Callable, Iterable, Iterator, List, Optional, Set
 
 import networkx as nx
 
@@ -156,7 +155,6 @@ class _MicrogridComponentGraph(ComponentGraph):
             raise InvalidGraphError("Must provide connections as well as components")
 
         self.refresh_from(components, connections)
-        self.validate()
 
     def components(
         self,
@@ -175,20 +173,43 @@ class _MicrogridComponentGraph(ComponentGraph):
             Set of the components currently connected to the microgrid, filtered
             by the provided `component_id` and `component_category` values.
         """
+        return set(self.iter_components(component_id, component_category))
+
+    def iter_components(
+        self,
+        component_id: Optional[Set[int]] = None,
+        component_category: Optional[Set[ComponentCategory]] = None,
+    ) -> Iterator[Component]:
+        """Iterate over the components of the microgrid.
+
+        Unlike `components`, this does not materialize a set, so it is the
+        cheaper choice for callers that just iterate, count or check
+        membership (e.g. the internal validation passes).
+
+        Args:
+            component_id: filter out any components not matching one of the
+                provided IDs
+            component_category: filter out any components not matching one of
+                the provided types
+
+        Yields:
+            The components currently connected to the microgrid, filtered by
+            the provided `component_id` and `component_category` values.
+        """
         if component_id is None:
             # If any node has not node[1], then it will not pass validations step.
-            selection: Iterable[Component] = map(
-                lambda node: Component(**(node[1])), self._graph.nodes(data=True)
+            selection: Iterable[Component] = (
+                data["component"] for _, data in self._graph.nodes(data=True)
             )
         else:
             valid_ids = filter(self._graph.has_node, component_id)
-            selection = map(lambda idx: Component(**self._graph.nodes[idx]), valid_ids)
+            selection = (self._graph.nodes[idx]["component"] for idx in valid_ids)
 
         if component_category is not None:
             types: Set[ComponentCategory] = component_category
-            selection = filter(lambda c: c.category in types, selection)
+            selection = (c for c in selection if c.category in types)
 
-        return set(selection)
+        yield from selection
 
     def connections(
         self,
@@ -219,7 +240,7 @@ class _MicrogridComponentGraph(ComponentGraph):
                 end_ids: Set[int] = end
                 selection = filter(lambda c: c[1] in end_ids, selection)
 
-        return set(map(lambda c: Connection(c[0], c[1]), selection))
+        return {Connection(*edge) for edge in selection}
 
     def predecessors(self, component_id: int) -> Set[Component]:
         """Fetch the graph predecessors of the specified component.
@@ -243,9 +264,7 @@ class _MicrogridComponentGraph(ComponentGraph):
 
         predecessors_ids = self._graph.predecessors(component_id)
 
-        return set(
-            map(lambda idx: Component(**self._graph.nodes[idx]), predecessors_ids)
-        )
+        return set(self._graph.nodes[idx]["component"] for idx in predecessors_ids)
 
     def successors(self, component_id: int) -> Set[Component]:
         """Fetch the graph successors of the specified component.
@@ -269,13 +288,14 @@ class _MicrogridComponentGraph(ComponentGraph):
 
         successors_ids = self._graph.successors(component_id)
 
-        return set(map(lambda idx: Component(**self._graph.nodes[idx]), successors_ids))
+        return set(self._graph.nodes[idx]["component"] for idx in successors_ids)
 
     def refresh_from(
         self,
         components: Set[Component],
         connections: Set[Connection],
         correct_errors: Optional[Callable[["_MicrogridComponentGraph"], None]] = None,
+        validate: bool = True,
     ) -> None:
         """Refresh the graph from the provided list of components and connections.
 
@@ -290,40 +310,46 @@ class _MicrogridComponentGraph(ComponentGraph):
             correct_errors: callback that, if set, will be invoked if the
                 provided graph data is in any way invalid (it will attempt to
                 correct the errors by inferring what the correct data should be)
+            validate: whether to validate the new graph data before accepting
+                it; callers that pass `False` are themselves responsible for
+                ensuring that the data forms a valid component graph
 
         Raises:
             InvalidGraphError: if the provided `components` and `connections`
                 do not form a valid component graph and `correct_errors` does
                 not fix it.
         """
-        if not all(component.is_valid() for component in components):
-            raise InvalidGraphError(f"Invalid components in input: {components}")
-        if not all(connection.is_valid() for connection in connections):
-            raise InvalidGraphError(f"Invalid connections in input: {connections}")
-
         new_graph = nx.DiGraph()
         for component in components:
-            new_graph.add_node(component.component_id, **asdict(component))
+            if not component.is_valid():
+                raise InvalidGraphError(f"Invalid components in input: {components}")
+            new_graph.add_node(component.component_id, component=component)
 
-        new_graph.add_edges_from(connections)
+        for connection in connections:
+            if not connection.is_valid():
+                raise InvalidGraphError(f"Invalid connections in input: {connections}")
+            new_graph.add_edge(connection.start, connection.end)
 
         # check if we can construct a valid ComponentGraph
         # from the new NetworkX graph data
         _provisional = _MicrogridComponentGraph()
         _provisional._graph = new_graph  # pylint: disable=protected-access
-        if correct_errors is not None:
+        if validate:
             try:
                 _provisional.validate()
             except InvalidGraphError as err:
+                if correct_errors is None:
+                    raise InvalidGraphError(
+                        "Cannot populate component graph from provided input!"
+                    ) from err
                 logger.warning("Attempting to fix invalid component data: %s", err)
                 correct_errors(_provisional)
-
-        try:
-            _provisional.validate()
-        except Exception as err:
-            raise InvalidGraphError(
-                "Cannot populate component graph from provided input!"
-            ) from err
+                try:
+                    _provisional.validate()
+                except Exception as corrected_err:
+                    raise InvalidGraphError(
+                        "Cannot populate component graph from provided input!"
+                    ) from corrected_err
 
         old_graph = self._graph
         self._graph = new_graph
@@ -333,6 +359,7 @@ class _MicrogridComponentGraph(ComponentGraph):
         self,
         api: MicrogridApiClient,
         correct_errors: Optional[Callable[["_MicrogridComponentGraph"], None]] = None,
+        validate: bool = True,
     ) -> None:
         """Refresh the contents of a component graph from the remote API.
 
@@ -341,13 +368,16 @@ class _MicrogridComponentGraph(ComponentGraph):
             correct_errors: callback that, if set, will be invoked if the
                 provided graph data is in any way invalid (it will attempt to
                 correct the errors by inferring what the correct data should be)
+            validate: whether to validate the new graph data before accepting
+                it; callers that pass `False` are themselves responsible for
+                ensuring that the data forms a valid component graph
         """
         components, connections = await asyncio.gather(
             api.components(),
             api.connections(),
         )
 
-        self.refresh_from(set(components), set(connections), correct_errors)
+        self.refresh_from(set(components), set(connections), correct_errors, validate)
 
     def validate(self) -> None:
         """Check that the component graph contains valid microgrid data."""
@@ -384,21 +414,9 @@ class _MicrogridComponentGraph(ComponentGraph):
             raise InvalidGraphError(
                 f"Missing definition for graph components: {undefined}"
             )
-        # should be true as a consequence of checks above
-        if sum(1 for _ in self.components()) <= 0:
-            raise InvalidGraphError("Graph must have a least one component!")
-        if sum(1 for _ in self.connections()) <= 0:
-            raise InvalidGraphError("Graph must have a least one connection!")
-
-        # should be true as a consequence of the tree property:
-        # there should be no unconnected components
-        unconnected = filter(
-            lambda c: self._graph.degree(c.component_id) == 0, self.components()
-        )
-        if sum(1 for _ in unconnected) != 0:
-            raise InvalidGraphError(
-                "Every component must have at least one connection!"
-            )
+        # the node and edge counts checked above already guarantee at least
+        # one component and connection, and the tree property guarantees that
+        # the graph is connected, so no further scans are needed
 
     def _validate_graph_root(self) -> None:
         """Check that there is exactly one node without predecessors, of valid type.
@@ -408,20 +426,18 @@ class _MicrogridComponentGraph(ComponentGraph):
                 or if there is a single such node that is not one of NONE, GRID, or
                 JUNCTION
         """
-        no_predecessors = filter(
-            lambda c: self._graph.in_degree(c.component_id) == 0,
-            self.components(),
-        )
-
         valid_root_types = {
             ComponentCategory.NONE,
             ComponentCategory.GRID,
             ComponentCategory.JUNCTION,
         }
 
-        valid_roots = list(
-            filter(lambda c: c.category in valid_root_types, no_predecessors)
-        )
+        valid_roots = [
+            c
+            for c in self.iter_components()
+            if c.category in valid_root_types
+            and self._graph.in_degree(c.component_id) == 0
+        ]
 
         if len(valid_roots) == 0:
             raise InvalidGraphError("No valid root nodes of component graph!")
@@ -443,7 +459,7 @@ class _MicrogridComponentGraph(ComponentGraph):
                 it has no successors in the graph (i.e. it is not connected to
                 anything)
         """
-        grid = list(self.components(component_category={ComponentCategory.GRID}))
+        grid = list(self.iter_components(component_category={ComponentCategory.GRID}))
 
         if len(grid) == 0:
             # it's OK to not have a grid endpoint as long as other properties
@@ -475,28 +491,22 @@ class _MicrogridComponentGraph(ComponentGraph):
             InvalidGraphError: if any intermediary component has zero predecessors
                 or zero successors
         """
-        intermediary_components = list(
-            self.components(component_category={ComponentCategory.INVERTER})
-        )
+        missing_predecessors: List[Component] = []
+        missing_successors: List[Component] = []
+        for component in self.iter_components(
+            component_category={ComponentCategory.INVERTER}
+        ):
+            if self._graph.in_degree(component.component_id) == 0:
+                missing_predecessors.append(component)
+            elif self._graph.out_degree(component.component_id) == 0:
+                missing_successors.append(component)
 
-        missing_predecessors = list(
-            filter(
-                lambda c: sum(1 for _ in self.predecessors(c.component_id)) == 0,
-                intermediary_components,
-            )
-        )
         if len(missing_predecessors) > 0:
             raise InvalidGraphError(
                 "Intermediary components without graph predecessors: "
                 f"{missing_predecessors}"
             )
 
-        missing_successors = list(
-            filter(
-                lambda c: sum(1 for _ in self.successors(c.component_id)) == 0,
-                intermediary_components,
-            )
-        )
         if len(missing_successors) > 0:
             raise InvalidGraphError(
                 "Intermediary components without graph successors: "
@@ -512,7 +522,9 @@ class _MicrogridComponentGraph(ComponentGraph):
                 which case it will have no predecessors: this is taken care of
                 by the `_validate_graph_root` check)
         """
-        junctions = self.components(component_category={ComponentCategory.JUNCTION})
+        junctions = self.iter_components(
+            component_category={ComponentCategory.JUNCTION}
+        )
         no_successors = list(
             filter(lambda c: self._graph.out_degree(c.component_id) == 0, junctions)
         )
@@ -532,33 +544,25 @@ class _MicrogridComponentGraph(ComponentGraph):
             InvalidGraphError: if any leaf component in the graph has 0 predecessors,
                 or has > 0 successors
         """
-        leaf_components = list(
-            self.components(
-                component_category={
-                    ComponentCategory.BATTERY,
-                    ComponentCategory.EV_CHARGER,
-                    ComponentCategory.PV_ARRAY,
-                }
-            )
-        )
+        missing_predecessors: List[Component] = []
+        with_successors: List[Component] = []
+        for component in self.iter_components(
+            component_category={
+                ComponentCategory.BATTERY,
+                ComponentCategory.EV_CHARGER,
+                ComponentCategory.PV_ARRAY,
+            }
+        ):
+            if self._graph.in_degree(component.component_id) == 0:
+                missing_predecessors.append(component)
+            elif self._graph.out_degree(component.component_id) > 0:
+                with_successors.append(component)
 
-        missing_predecessors = list(
-            filter(
-                lambda c: sum(1 for _ in self.predecessors(c.component_id)) == 0,
-                leaf_components,
-            )
-        )
         if len(missing_predecessors) > 0:
             raise InvalidGraphError(
                 f"Leaf components without graph predecessors: {missing_predecessors}"
             )
 
-        with_successors = list(
-            filter(
-                lambda c: sum(1 for _ in self.successors(c.component_id)) > 0,
-                leaf_components,
-            )
-        )
         if len(with_successors) > 0:
             raise InvalidGraphError(
                 f"Leaf components with graph successors: {with_successors}"
@@ -583,7 +587,8 @@ def _correct_graph_errors(graph: _MicrogridComponentGraph) -> None:
         graph._graph.has_node(0)  # pylint: disable=protected-access
         and graph._graph.in_degree(0) == 0  # pylint: disable=protected-access
         and graph._graph.out_degree(0) > 0  # pylint: disable=protected-access
-        and "type" not in graph._graph.nodes[0]  # pylint: disable=protected-access
+        and "component" not in graph._graph.nodes[0]  # pylint: disable=protected-access
     ):
         # pylint: disable=protected-access
-        graph._graph.add_node(0, **asdict(Component(0, ComponentCategory.GRID)))
+        grid = Component(0, ComponentCategory.GRID)
+        graph._graph.add_node(0, component=grid)
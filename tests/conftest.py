@@ -19,13 +19,10 @@ SAFETY_TIMEOUT = 10.0
 def disable_actor_auto_restart():  # type: ignore
     """Disable auto-restart of actors while running tests.
 
-    Since this is auto-use, the yield part (and restore of the variable) is not
-    strictly needed, but we leave it as an example.
+    The attribute is set once for the whole session; nothing restores it,
+    so no teardown (and no generator frame held for the session) is needed.
 
     Note: Test class must derive after unittest.IsolatedAsyncioTestCase.
     Otherwise this fixture won't run.
     """
-    original_restart_limit = decorator.BaseActor.restart_limit
     decorator.BaseActor.restart_limit = 0
-    yield
-    decorator.BaseActor.restart_limit = original_restart_limit
@@ -12,7 +12,6 @@ MIT
 # pylint: disable=invalid-name,missing-function-docstring,too-many-statements
 # pylint: disable=too-many-lines,protected-access
 
-from dataclasses import asdict
 from typing import Dict, Set
 
 import frequenz.api.microgrid.microgrid_pb2 as microgrid_pb
@@ -669,6 +668,29 @@ class Test_MicrogridComponentGraph:
         assert graph.connections() == {Connection(10, 11)}
         graph.validate()
 
+    def test_refresh_from_skip_validation(self) -> None:
+        graph = gr._MicrogridComponentGraph()
+
+        # graph data that validation rejects (a junction with no successors)
+        # is refused with the default `validate=True` ...
+        components = {
+            Component(7, ComponentCategory.GRID),
+            Component(9, ComponentCategory.JUNCTION),
+        }
+        connections = {Connection(7, 9)}
+
+        with pytest.raises(gr.InvalidGraphError):
+            graph.refresh_from(components, connections)
+        assert graph.components() == set()
+        assert graph.connections() == set()
+
+        # ... but accepted when the caller opts out of validation
+        graph.refresh_from(components, connections, validate=False)
+        assert graph.components() == components
+        assert graph.connections() == connections
+        with pytest.raises(gr.InvalidGraphError):
+            graph.validate()
+
     async def test_refresh_from_api(self) -> None:
         graph = gr._MicrogridComponentGraph()
         assert graph.components() == set()
@@ -800,9 +822,9 @@ class Test_MicrogridComponentGraph:
         graph._graph.clear()
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.GRID))),
-                (2, asdict(Component(2, ComponentCategory.NONE))),
-                (3, asdict(Component(3, ComponentCategory.METER))),
+                (1, {"component": Component(1, ComponentCategory.GRID)}),
+                (2, {"component": Component(2, ComponentCategory.NONE)}),
+                (3, {"component": Component(3, ComponentCategory.METER)}),
             ]
         )
         graph._graph.add_edges_from([(1, 3), (2, 3)])
@@ -813,9 +835,9 @@ class Test_MicrogridComponentGraph:
         graph._graph.clear()
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.GRID))),
-                (2, asdict(Component(2, ComponentCategory.GRID))),
-                (3, asdict(Component(3, ComponentCategory.METER))),
+                (1, {"component": Component(1, ComponentCategory.GRID)}),
+                (2, {"component": Component(2, ComponentCategory.GRID)}),
+                (3, {"component": Component(3, ComponentCategory.METER)}),
             ]
         )
         graph._graph.add_edges_from([(1, 2), (2, 3)])
@@ -829,8 +851,8 @@ class Test_MicrogridComponentGraph:
         graph._graph.clear()
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.GRID))),
-                (2, asdict(Component(2, ComponentCategory.JUNCTION))),
+                (1, {"component": Component(1, ComponentCategory.GRID)}),
+                (2, {"component": Component(2, ComponentCategory.JUNCTION)}),
             ]
         )
         graph._graph.add_edges_from([(1, 2)])
@@ -844,9 +866,9 @@ class Test_MicrogridComponentGraph:
         graph._graph.clear()
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.GRID))),
-                (2, asdict(Component(2, ComponentCategory.BATTERY))),
-                (3, asdict(Component(3, ComponentCategory.METER))),
+                (1, {"component": Component(1, ComponentCategory.GRID)}),
+                (2, {"component": Component(2, ComponentCategory.BATTERY)}),
+                (3, {"component": Component(3, ComponentCategory.METER)}),
             ]
         )
         graph._graph.add_edges_from([(1, 2), (2, 3)])
@@ -879,9 +901,9 @@ class Test_MicrogridComponentGraph:
         graph._graph.clear()
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.GRID))),
-                (2, asdict(Component(2, ComponentCategory.JUNCTION))),
-                (3, asdict(Component(3, ComponentCategory.METER))),
+                (1, {"component": Component(1, ComponentCategory.GRID)}),
+                (2, {"component": Component(2, ComponentCategory.JUNCTION)}),
+                (3, {"component": Component(3, ComponentCategory.METER)}),
             ]
         )
         graph._graph.add_edges_from([(1, 2), (2, 3), (3, 2)])
@@ -894,9 +916,9 @@ class Test_MicrogridComponentGraph:
         # (this violates the tree property):
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.GRID))),
-                (2, asdict(Component(2, ComponentCategory.METER))),
-                (3, asdict(Component(3, ComponentCategory.NONE))),
+                (1, {"component": Component(1, ComponentCategory.GRID)}),
+                (2, {"component": Component(2, ComponentCategory.METER)}),
+                (3, {"component": Component(3, ComponentCategory.NONE)}),
             ]
         )
         graph._graph.add_edges_from([(1, 2)])
@@ -919,9 +941,9 @@ class Test_MicrogridComponentGraph:
         graph._graph.clear()
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.JUNCTION))),
-                (2, asdict(Component(2, ComponentCategory.JUNCTION))),
-                (3, asdict(Component(3, ComponentCategory.JUNCTION))),
+                (1, {"component": Component(1, ComponentCategory.JUNCTION)}),
+                (2, {"component": Component(2, ComponentCategory.JUNCTION)}),
+                (3, {"component": Component(3, ComponentCategory.JUNCTION)}),
             ]
         )
         graph._graph.add_edges_from([(1, 2), (2, 3), (3, 1)])
@@ -935,9 +957,9 @@ class Test_MicrogridComponentGraph:
         graph._graph.clear()
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.METER))),
-                (2, asdict(Component(2, ComponentCategory.INVERTER))),
-                (3, asdict(Component(3, ComponentCategory.BATTERY))),
+                (1, {"component": Component(1, ComponentCategory.METER)}),
+                (2, {"component": Component(2, ComponentCategory.INVERTER)}),
+                (3, {"component": Component(3, ComponentCategory.BATTERY)}),
             ]
         )
         graph._graph.add_edges_from([(1, 2), (2, 3)])
@@ -951,9 +973,9 @@ class Test_MicrogridComponentGraph:
         graph._graph.clear()
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.NONE))),
-                (2, asdict(Component(2, ComponentCategory.GRID))),
-                (3, asdict(Component(3, ComponentCategory.METER))),
+                (1, {"component": Component(1, ComponentCategory.NONE)}),
+                (2, {"component": Component(2, ComponentCategory.GRID)}),
+                (3, {"component": Component(3, ComponentCategory.METER)}),
             ]
         )
         graph._graph.add_edges_from([(1, 3), (2, 3)])
@@ -963,9 +985,9 @@ class Test_MicrogridComponentGraph:
         graph._graph.clear()
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.GRID))),
-                (2, asdict(Component(2, ComponentCategory.JUNCTION))),
-                (3, asdict(Component(3, ComponentCategory.METER))),
+                (1, {"component": Component(1, ComponentCategory.GRID)}),
+                (2, {"component": Component(2, ComponentCategory.JUNCTION)}),
+                (3, {"component": Component(3, ComponentCategory.METER)}),
             ]
         )
         graph._graph.add_edges_from([(1, 3), (2, 3)])
@@ -975,14 +997,18 @@ class Test_MicrogridComponentGraph:
         # there is just one potential root node but it has no successors
         graph._graph.clear()
 
-        graph._graph.add_nodes_from([(1, asdict(Component(1, ComponentCategory.NONE)))])
+        graph._graph.add_nodes_from(
+            [(1, {"component": Component(1, ComponentCategory.NONE)})]
+        )
         with pytest.raises(
             gr.InvalidGraphError, match="Graph root .*id=1.* has no successors!"
         ):
             graph._validate_graph_root()
 
         graph._graph.clear()
-        graph._graph.add_nodes_from([(2, asdict(Component(2, ComponentCategory.GRID)))])
+        graph._graph.add_nodes_from(
+            [(2, {"component": Component(2, ComponentCategory.GRID)})]
+        )
         with pytest.raises(
             gr.InvalidGraphError, match="Graph root .*id=2.* has no successors!"
         ):
@@ -991,7 +1017,7 @@ class Test_MicrogridComponentGraph:
         graph._graph.clear()
 
         graph._graph.add_nodes_from(
-            [(3, asdict(Component(3, ComponentCategory.JUNCTION)))]
+            [(3, {"component": Component(3, ComponentCategory.JUNCTION)})]
         )
         with pytest.raises(
             gr.InvalidGraphError, match="Graph root .*id=3.* has no successors!"
@@ -1002,8 +1028,8 @@ class Test_MicrogridComponentGraph:
         graph._graph.clear()
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.NONE))),
-                (2, asdict(Component(2, ComponentCategory.METER))),
+                (1, {"component": Component(1, ComponentCategory.NONE)}),
+                (2, {"component": Component(2, ComponentCategory.METER)}),
             ]
         )
         graph._graph.add_edges_from([(1, 2)])
@@ -1012,8 +1038,8 @@ class Test_MicrogridComponentGraph:
         graph._graph.clear()
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.GRID))),
-                (2, asdict(Component(2, ComponentCategory.METER))),
+                (1, {"component": Component(1, ComponentCategory.GRID)}),
+                (2, {"component": Component(2, ComponentCategory.METER)}),
             ]
         )
         graph._graph.add_edges_from([(1, 2)])
@@ -1022,8 +1048,8 @@ class Test_MicrogridComponentGraph:
         graph._graph.clear()
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.JUNCTION))),
-                (2, asdict(Component(2, ComponentCategory.METER))),
+                (1, {"component": Component(1, ComponentCategory.JUNCTION)}),
+                (2, {"component": Component(2, ComponentCategory.METER)}),
             ]
         )
         graph._graph.add_edges_from([(1, 2)])
@@ -1040,7 +1066,7 @@ class Test_MicrogridComponentGraph:
         # missing grid endpoint is OK as the graph might have
         # another kind of root
         graph._graph.clear()
-        graph._graph.add_node(2, **asdict(Component(2, ComponentCategory.METER)))
+        graph._graph.add_node(2, component=Component(2, ComponentCategory.METER))
 
         graph._validate_grid_endpoint()
 
@@ -1048,9 +1074,9 @@ class Test_MicrogridComponentGraph:
         graph._graph.clear()
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.GRID))),
-                (2, asdict(Component(2, ComponentCategory.METER))),
-                (3, asdict(Component(3, ComponentCategory.GRID))),
+                (1, {"component": Component(1, ComponentCategory.GRID)}),
+                (2, {"component": Component(2, ComponentCategory.METER)}),
+                (3, {"component": Component(3, ComponentCategory.GRID)}),
             ]
         )
         graph._graph.add_edges_from([(1, 2), (3, 2)])
@@ -1064,8 +1090,8 @@ class Test_MicrogridComponentGraph:
         graph._graph.clear()
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.GRID))),
-                (99, asdict(Component(99, ComponentCategory.METER))),
+                (1, {"component": Component(1, ComponentCategory.GRID)}),
+                (99, {"component": Component(99, ComponentCategory.METER)}),
             ]
         )
         graph._graph.add_edge(99, 1)
@@ -1079,7 +1105,7 @@ class Test_MicrogridComponentGraph:
         # grid endpoint has no successors
         graph._graph.clear()
 
-        graph._graph.add_node(101, **asdict(Component(101, ComponentCategory.GRID)))
+        graph._graph.add_node(101, component=Component(101, ComponentCategory.GRID))
         with pytest.raises(
             gr.InvalidGraphError,
             match="Grid endpoint 101 has no graph successors!",
@@ -1090,8 +1116,8 @@ class Test_MicrogridComponentGraph:
         graph._graph.clear()
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.GRID))),
-                (2, asdict(Component(2, ComponentCategory.METER))),
+                (1, {"component": Component(1, ComponentCategory.GRID)}),
+                (2, {"component": Component(2, ComponentCategory.METER)}),
             ]
         )
         graph._graph.add_edge(1, 2)
@@ -1107,7 +1133,7 @@ class Test_MicrogridComponentGraph:
 
         # missing predecessor for at least one intermediary node
         graph._graph.clear()
-        graph._graph.add_node(3, **asdict(Component(3, ComponentCategory.INVERTER)))
+        graph._graph.add_node(3, component=Component(3, ComponentCategory.INVERTER))
         with pytest.raises(
             gr.InvalidGraphError,
             match="Intermediary components without graph predecessors",
@@ -1117,8 +1143,8 @@ class Test_MicrogridComponentGraph:
         graph._graph.clear()
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.GRID))),
-                (3, asdict(Component(3, ComponentCategory.INVERTER))),
+                (1, {"component": Component(1, ComponentCategory.GRID)}),
+                (3, {"component": Component(3, ComponentCategory.INVERTER)}),
             ]
         )
         graph._graph.add_edges_from([(1, 3)])
@@ -1132,9 +1158,9 @@ class Test_MicrogridComponentGraph:
 
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.GRID))),
-                (2, asdict(Component(2, ComponentCategory.METER))),
-                (3, asdict(Component(3, ComponentCategory.INVERTER))),
+                (1, {"component": Component(1, ComponentCategory.GRID)}),
+                (2, {"component": Component(2, ComponentCategory.METER)}),
+                (3, {"component": Component(3, ComponentCategory.INVERTER)}),
             ]
         )
         graph._graph.add_edges_from([(1, 2), (2, 3)])
@@ -1149,10 +1175,10 @@ class Test_MicrogridComponentGraph:
         graph._graph.clear()
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.GRID))),
-                (2, asdict(Component(2, ComponentCategory.METER))),
-                (3, asdict(Component(3, ComponentCategory.INVERTER))),
-                (4, asdict(Component(4, ComponentCategory.BATTERY))),
+                (1, {"component": Component(1, ComponentCategory.GRID)}),
+                (2, {"component": Component(2, ComponentCategory.METER)}),
+                (3, {"component": Component(3, ComponentCategory.INVERTER)}),
+                (4, {"component": Component(4, ComponentCategory.BATTERY)}),
             ]
         )
         graph._graph.add_edges_from([(1, 2), (2, 3), (3, 4)])
@@ -1166,7 +1192,7 @@ class Test_MicrogridComponentGraph:
         # successors missing for at least one junction
         graph._graph.clear()
         graph._graph.add_nodes_from(
-            [(1, asdict(Component(1, ComponentCategory.JUNCTION)))]
+            [(1, {"component": Component(1, ComponentCategory.JUNCTION)})]
         )
         with pytest.raises(
             gr.InvalidGraphError, match="Junctions missing graph successors"
@@ -1176,8 +1202,8 @@ class Test_MicrogridComponentGraph:
         graph._graph.clear()
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.JUNCTION))),
-                (2, asdict(Component(2, ComponentCategory.JUNCTION))),
+                (1, {"component": Component(1, ComponentCategory.JUNCTION)}),
+                (2, {"component": Component(2, ComponentCategory.JUNCTION)}),
             ]
         )
         graph._graph.add_edges_from([(1, 2)])
@@ -1190,9 +1216,9 @@ class Test_MicrogridComponentGraph:
         graph._graph.clear()
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.JUNCTION))),
-                (2, asdict(Component(2, ComponentCategory.JUNCTION))),
-                (3, asdict(Component(3, ComponentCategory.METER))),
+                (1, {"component": Component(1, ComponentCategory.JUNCTION)}),
+                (2, {"component": Component(2, ComponentCategory.JUNCTION)}),
+                (3, {"component": Component(3, ComponentCategory.METER)}),
             ]
         )
 
@@ -1209,21 +1235,21 @@ class Test_MicrogridComponentGraph:
 
         # missing predecessor for at least one leaf node
         graph._graph.clear()
-        graph._graph.add_node(3, **asdict(Component(3, ComponentCategory.BATTERY)))
+        graph._graph.add_node(3, component=Component(3, ComponentCategory.BATTERY))
         with pytest.raises(
             gr.InvalidGraphError, match="Leaf components without graph predecessors"
         ):
             graph._validate_leaf_components()
 
         graph._graph.clear()
-        graph._graph.add_node(4, **asdict(Component(4, ComponentCategory.EV_CHARGER)))
+        graph._graph.add_node(4, component=Component(4, ComponentCategory.EV_CHARGER))
         with pytest.raises(
             gr.InvalidGraphError, match="Leaf components without graph predecessors"
         ):
             graph._validate_leaf_components()
 
         graph._graph.clear()
-        graph._graph.add_node(5, **asdict(Component(5, ComponentCategory.PV_ARRAY)))
+        graph._graph.add_node(5, component=Component(5, ComponentCategory.PV_ARRAY))
         with pytest.raises(
             gr.InvalidGraphError, match="Leaf components without graph predecessors"
         ):
@@ -1233,9 +1259,9 @@ class Test_MicrogridComponentGraph:
         graph._graph.clear()
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.GRID))),
-                (2, asdict(Component(2, ComponentCategory.EV_CHARGER))),
-                (3, asdict(Component(3, ComponentCategory.BATTERY))),
+                (1, {"component": Component(1, ComponentCategory.GRID)}),
+                (2, {"component": Component(2, ComponentCategory.EV_CHARGER)}),
+                (3, {"component": Component(3, ComponentCategory.BATTERY)}),
             ]
         )
 
@@ -1248,9 +1274,9 @@ class Test_MicrogridComponentGraph:
         graph._graph.clear()
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.GRID))),
-                (3, asdict(Component(3, ComponentCategory.BATTERY))),
-                (4, asdict(Component(4, ComponentCategory.EV_CHARGER))),
+                (1, {"component": Component(1, ComponentCategory.GRID)}),
+                (3, {"component": Component(3, ComponentCategory.BATTERY)}),
+                (4, {"component": Component(4, ComponentCategory.EV_CHARGER)}),
             ]
         )
         graph._graph.add_edges_from([(1, 3), (3, 4)])
@@ -1262,9 +1288,9 @@ class Test_MicrogridComponentGraph:
         graph._graph.clear()
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.GRID))),
-                (4, asdict(Component(4, ComponentCategory.EV_CHARGER))),
-                (5, asdict(Component(5, ComponentCategory.PV_ARRAY))),
+                (1, {"component": Component(1, ComponentCategory.GRID)}),
+                (4, {"component": Component(4, ComponentCategory.EV_CHARGER)}),
+                (5, {"component": Component(5, ComponentCategory.PV_ARRAY)}),
             ]
         )
         graph._graph.add_edges_from([(1, 5), (5, 4)])
@@ -1278,11 +1304,11 @@ class Test_MicrogridComponentGraph:
         graph._graph.clear()
         graph._graph.add_nodes_from(
             [
-                (1, asdict(Component(1, ComponentCategory.GRID))),
-                (2, asdict(Component(2, ComponentCategory.METER))),
-                (3, asdict(Component(3, ComponentCategory.BATTERY))),
-                (4, asdict(Component(4, ComponentCategory.EV_CHARGER))),
-                (5, asdict(Component(5, ComponentCategory.PV_ARRAY))),
+                (1, {"component": Component(1, ComponentCategory.GRID)}),
+                (2, {"component": Component(2, ComponentCategory.METER)}),
+                (3, {"component": Component(3, ComponentCategory.BATTERY)}),
+                (4, {"component": Component(4, ComponentCategory.EV_CHARGER)}),
+                (5, {"component": Component(5, ComponentCategory.PV_ARRAY)}),
             ]
         )
         graph._graph.add_edges_from([(1, 2), (1, 3), (1, 4), (1, 5)])
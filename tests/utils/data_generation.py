@@ -24,6 +24,37 @@ from google.protobuf.timestamp_pb2 import Timestamp  # pylint: disable=no-name-i
 
 from frequenz.sdk.microgrid import BatteryData, EVChargerData, InverterData, MeterData
 
+# Default data templates, built once instead of per generated message.  It is
+# safe to share them: protobuf copies message fields on assignment into a
+# parent message, so the templates are never mutated.
+_DEFAULT_BATTERY_DC = DC(
+    power=Metric(value=100.0, system_bounds=Bounds(lower=-1000.0, upper=1000.0))
+)
+_DEFAULT_INVERTER_DATA = PbInverterData(
+    ac=AC(
+        power_active=Metric(
+            value=100.0, system_bounds=Bounds(lower=-1000.0, upper=1000.0)
+        )
+    )
+)
+_DEFAULT_METER_DATA = PbMeterData(
+    ac=AC(power_active=Metric(value=100.0)),
+)
+_DEFAULT_EV_CHARGER_DATA = PbEVChargerData(
+    ac=AC(
+        power_active=Metric(
+            value=100.0,
+            system_bounds=Bounds(lower=-1000.0, upper=1000.0),
+        ),
+    ),
+    dc=DC(
+        power=Metric(
+            value=100.0,
+            system_bounds=Bounds(lower=-1000.0, upper=1000.0),
+        ),
+    ),
+)
+
 
 def generate_battery_data(
     component_id: int,
@@ -56,11 +87,7 @@ def generate_battery_data(
         properties=BatteryProperties(capacity=float(component_id % 100)),
         data=PbBatteryData(
             soc=MetricAggregation(avg=float(component_id % 100)),
-            dc=DC(
-                power=Metric(
-                    value=100.0, system_bounds=Bounds(lower=-1000.0, upper=1000.0)
-                )
-            ),
+            dc=_DEFAULT_BATTERY_DC,
         ),
     )
 
@@ -108,15 +135,7 @@ def generate_inverter_data(
 
     timestamp.GetCurrentTime()
 
-    _params: Dict[str, Any] = dict(
-        data=PbInverterData(
-            ac=AC(
-                power_active=Metric(
-                    value=100.0, system_bounds=Bounds(lower=-1000.0, upper=1000.0)
-                )
-            )
-        )
-    )
+    _params: Dict[str, Any] = dict(data=_DEFAULT_INVERTER_DATA)
 
     if params is not None:
         _params.update(params)
@@ -162,11 +181,7 @@ def generate_meter_data(
 
     timestamp.GetCurrentTime()
 
-    _params: Dict[str, Any] = dict(
-        data=PbMeterData(
-            ac=AC(power_active=Metric(value=100.0)),
-        )
-    )
+    _params: Dict[str, Any] = dict(data=_DEFAULT_METER_DATA)
 
     if params is not None:
         _params.update(params)
@@ -212,22 +227,7 @@ def generate_ev_charger_data(
 
     timestamp.GetCurrentTime()
 
-    _params: Dict[str, Any] = dict(
-        data=PbEVChargerData(
-            ac=AC(
-                power_active=Metric(
-                    value=100.0,
-                    system_bounds=Bounds(lower=-1000.0, upper=1000.0),
-                ),
-            ),
-            dc=DC(
-                power=Metric(
-                    value=100.0,
-                    system_bounds=Bounds(lower=-1000.0, upper=1000.0),
-                ),
-            ),
-        )
-    )
+    _params: Dict[str, Any] = dict(data=_DEFAULT_EV_CHARGER_DATA)
 
     if params is not None:
         _params.update(params)